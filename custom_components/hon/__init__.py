@@ -1,14 +1,20 @@
+import asyncio
 import logging
 from pathlib import Path
 
 import voluptuous as vol  # type: ignore[import-untyped]
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, aiohttp_client
 from homeassistant.helpers.typing import HomeAssistantType
-from pyhon import Hon
 
-from .const import DOMAIN, PLATFORMS
+from .catalog import HonCatalog
+from .const import DOMAIN, SETUP_TIMEOUT
+from .discovery import HonDiscovery
+from .poller import HonPhaseAllocator, HonPoller
+from .profiler import HonSetupProfiler
+from .snapshot import HonSession, HonSnapshotAPI, snapshot_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,26 +35,91 @@ async def async_setup_entry(hass: HomeAssistantType, entry: ConfigEntry) -> bool
     session = aiohttp_client.async_get_clientsession(hass)
     if (config_dir := hass.config.config_dir) is None:
         raise ValueError("Missing Config Dir")
-    hon = await Hon(
+    hass.data.setdefault(DOMAIN, {})
+    profiler = HonSetupProfiler(entry.data["email"])
+    hass.data[DOMAIN].setdefault("profilers", {})[entry.unique_id] = profiler
+    catalog = hass.data[DOMAIN].setdefault("catalog", HonCatalog(hass))
+    with profiler.phase("catalog"):
+        await catalog.async_load()
+    api = HonSnapshotAPI(
+        hass,
+        entry.entry_id,
+        catalog,
+        profiler,
         entry.data["email"],
         entry.data["password"],
+        session,
+    )
+    hon = HonSession(
+        api,
+        email=entry.data["email"],
+        password=entry.data["password"],
         session=session,
         test_data_path=Path(config_dir),
-    ).create()
-    hass.data.setdefault(DOMAIN, {})
+    )
+    # A config flow which just logged in hands over its session
+    login = hass.data[DOMAIN].get("sessions", {}).pop(entry.unique_id, None)
+    with profiler.phase("snapshot"):
+        restored = login is None and await api.async_load()
+    if restored:
+        with profiler.phase("appliances"):
+            await hon.create()
+    else:
+        try:
+            async with asyncio.timeout(SETUP_TIMEOUT):
+                with profiler.phase("login"):
+                    if login is None:
+                        await api.async_connect()
+                    else:
+                        api.attach(*login)
+                with profiler.phase("appliances"):
+                    await hon.create()
+        except Exception as error:  # pylint: disable=broad-except
+            raise ConfigEntryNotReady(f"Can't connect to hOn: {error}") from error
+    api.async_save()
+    # Writing now cancels the delayed save, which would outlive a removed entry
+    entry.async_on_unload(api.async_flush)
     hass.data[DOMAIN][entry.unique_id] = hon
-    hass.data[DOMAIN]["coordinators"] = {}
-
-    for platform in PLATFORMS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(entry, platform)
+    phases = hass.data[DOMAIN].setdefault("phases", HonPhaseAllocator())
+    poller = HonPoller(hass, entry, hon, api, phases)
+    hass.data[DOMAIN].setdefault("pollers", {})[entry.unique_id] = poller
+    entry.async_on_unload(poller.async_shutdown)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    with profiler.phase("first_refresh"):
+        await poller.async_config_entry_first_refresh(profiler)
+    poller.async_schedule()
+    if restored:
+        entry.async_create_background_task(
+            hass, poller.async_reconcile(), f"{DOMAIN}_reconcile"
         )
+
+    with profiler.phase("discovery"):
+        discovery = HonDiscovery(hon.appliances)
+    hass.data[DOMAIN].setdefault("discovery", {})[entry.unique_id] = discovery
+    with profiler.phase("platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, discovery.platforms)
+    profiler.finish()
     return True
 
 
+async def async_update_options(hass: HomeAssistantType, entry: ConfigEntry) -> None:
+    hass.data[DOMAIN]["pollers"][entry.unique_id].async_set_options(entry.options)
+
+
 async def async_unload_entry(hass: HomeAssistantType, entry: ConfigEntry) -> bool:
-    unload = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    discovery: HonDiscovery = hass.data[DOMAIN]["discovery"][entry.unique_id]
+    unload = await hass.config_entries.async_unload_platforms(
+        entry, discovery.platforms
+    )
     if unload:
+        hass.data[DOMAIN].pop(entry.unique_id, None)
+        hass.data[DOMAIN]["pollers"].pop(entry.unique_id, None)
+        hass.data[DOMAIN]["discovery"].pop(entry.unique_id, None)
+        hass.data[DOMAIN]["profilers"].pop(entry.unique_id, None)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
     return unload
+
+
+async def async_remove_entry(hass: HomeAssistantType, entry: ConfigEntry) -> None:
+    await snapshot_store(hass, entry.entry_id).async_remove()
@@ -0,0 +1,95 @@
+import logging
+import random
+from enum import StrEnum
+from time import monotonic
+from typing import Any
+
+from .const import (
+    BREAKER_BACKOFF,
+    BREAKER_BACKOFF_MAX,
+    BREAKER_PROBE_WAIT,
+    BREAKER_THRESHOLD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HonBreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class HonCircuitBreaker:
+    """Pause all requests of an account while the hOn cloud keeps failing."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._state = HonBreakerState.CLOSED
+        self._failures: int = 0
+        self._trips: int = 0
+        self._open_until: float = 0
+        self._probing: bool = False
+
+    @property
+    def state(self) -> HonBreakerState:
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        if self._state == HonBreakerState.HALF_OPEN and self._probing:
+            return BREAKER_PROBE_WAIT
+        if self._state != HonBreakerState.OPEN:
+            return 0
+        return max(self._open_until - monotonic(), 0)
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "state": self._state,
+            "failures": self._failures,
+            "trips": self._trips,
+            "retry_in": round(self.retry_in),
+        }
+
+    def allow(self) -> bool:
+        if self._state == HonBreakerState.CLOSED:
+            return True
+        if self._state == HonBreakerState.OPEN and not self.retry_in:
+            self._state = HonBreakerState.HALF_OPEN
+            self._probing = False
+        if self._state == HonBreakerState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """Let the next caller probe if the current one ended without a result"""
+        self._probing = False
+
+    def success(self) -> None:
+        if self._state != HonBreakerState.CLOSED:
+            _LOGGER.info("%s - hOn requests recovered", self._name)
+        self._state = HonBreakerState.CLOSED
+        self._failures = 0
+        self._trips = 0
+        self._probing = False
+
+    def failure(self) -> None:
+        self._failures += 1
+        if self._state == HonBreakerState.OPEN:
+            return
+        if self._state == HonBreakerState.CLOSED and self._failures < BREAKER_THRESHOLD:
+            return
+        backoff = min(BREAKER_BACKOFF * 2**self._trips, BREAKER_BACKOFF_MAX)
+        backoff *= random.uniform(0.8, 1.2)
+        self._trips += 1
+        self._state = HonBreakerState.OPEN
+        self._open_until = monotonic() + backoff
+        self._probing = False
+        _LOGGER.warning(
+            "%s - hOn requests failed %s times, pausing for %.0f s",
+            self._name,
+            self._failures,
+            backoff,
+        )
@@ -0,0 +1,65 @@
+import asyncio
+from time import monotonic
+from typing import Any
+
+from .const import BUDGET_CAPACITY, BUDGET_RATE, BUDGET_RESERVE
+
+
+class HonRequestBudget:
+    """Token bucket shared by all requests of one hOn account."""
+
+    def __init__(self) -> None:
+        self._tokens: float = BUDGET_CAPACITY
+        self._updated: float = monotonic()
+        self._polls: int = 0
+        self._priority: int = 0
+        self._denied: int = 0
+        self._waited: float = 0
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated) * BUDGET_RATE, BUDGET_CAPACITY
+        )
+        self._updated = now
+
+    @property
+    def pressure(self) -> float:
+        """Share of the poll budget in use, from 0 to 1"""
+        self._refill()
+        available = (self._tokens - BUDGET_RESERVE) / (BUDGET_CAPACITY - BUDGET_RESERVE)
+        return min(max(1 - available, 0), 1)
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 1),
+            "capacity": BUDGET_CAPACITY,
+            "rate": BUDGET_RATE,
+            "polls": self._polls,
+            "priority": self._priority,
+            "denied_polls": self._denied,
+            "priority_wait": round(self._waited, 1),
+        }
+
+    def try_acquire(self, cost: int = 1) -> bool:
+        """Take tokens for a poll, keeping the reserve for priority requests"""
+        self._refill()
+        if self._tokens - cost < BUDGET_RESERVE:
+            self._denied += 1
+            return False
+        self._tokens -= cost
+        self._polls += cost
+        return True
+
+    async def acquire(self, cost: int = 1) -> None:
+        """Take tokens for a priority request, waiting until they are available"""
+        self._refill()
+        while self._tokens < cost:
+            delay = (cost - self._tokens) / BUDGET_RATE
+            self._waited += delay
+            await asyncio.sleep(delay)
+            self._refill()
+        self._tokens -= cost
+        self._priority += cost
@@ -10,7 +10,9 @@ from homeassistant.helpers.typing import HomeAssistantType
 from pyhon.appliance import HonAppliance
 
 from .const import DOMAIN
+from .discovery import HonApplianceIndex, get_plan
 from .hon import HonEntity
+from .profiler import profile_platform
 from .typedefs import HonButtonType
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,20 +43,21 @@ BUTTONS: dict[str, tuple[ButtonEntityDescription, ...]] = {
 }
 
 
+def discover(index: HonApplianceIndex, description: ButtonEntityDescription) -> bool:
+    return index.has_command(description.key)
+
+
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    entities: list[HonButtonType] = []
+    entities: list[HonButtonType] = [
+        HonButtonEntity(hass, entry, device, description)
+        for device, description in get_plan(hass, entry, "button")
+    ]
     for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in BUTTONS.get(device.appliance_type, []):
-            if not device.commands.get(description.key):
-                continue
-            entity = HonButtonEntity(hass, entry, device, description)
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
         entities.append(HonDeviceInfo(hass, entry, device))
         entities.append(HonDataArchive(hass, entry, device))
-        await entities[-1].coordinator.async_config_entry_first_refresh()
     async_add_entities(entities)
 
 
@@ -62,16 +65,12 @@ class HonButtonEntity(HonEntity, ButtonEntity):
     entity_description: ButtonEntityDescription
 
     async def async_press(self) -> None:
-        await self._device.commands[self.entity_description.key].send()
+        await self.coordinator.async_send_command(self.entity_description.key)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and int(self._device.get("remoteCtrValid", "1")) == 1
-            and self._device.get("attributes.lastConnEvent.category") != "DISCONNECTED"
-        )
+        return self.controllable
 
 
 class HonDeviceInfo(HonEntity, ButtonEntity):
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from copy import deepcopy
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import HomeAssistantType
+
+from .const import CATALOG_REVALIDATE, DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+
+
+class HonCatalog:
+    """Command definitions of all appliances, cached per model and firmware."""
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.catalog"
+        )
+        self._catalog: dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        self._loaded: bool = False
+
+    @staticmethod
+    def _key(info: dict[str, Any]) -> str:
+        return "_".join(
+            str(info.get(key, ""))
+            for key in (
+                "applianceTypeName",
+                "applianceModelId",
+                "eepromId",
+                "fwVersion",
+            )
+        )
+
+    async def async_load(self) -> None:
+        async with self._lock:
+            if not self._loaded:
+                self._catalog = await self._store.async_load() or {}
+                self._loaded = True
+
+    def get(self, info: dict[str, Any]) -> dict[str, Any] | None:
+        if (entry := self._catalog.get(self._key(info))) is None:
+            return None
+        commands: dict[str, Any] = entry["commands"]
+        return deepcopy(commands)
+
+    def expired(self, info: dict[str, Any]) -> bool:
+        entry = self._catalog.get(self._key(info), {})
+        return bool(entry.get("validated", 0) + CATALOG_REVALIDATE < time.time())
+
+    @callback
+    def async_set(self, info: dict[str, Any], commands: dict[str, Any]) -> bool:
+        """Store commands, empty ones too, and return if they changed"""
+        key = self._key(info)
+        changed = bool(self._catalog.get(key, {}).get("commands") != commands)
+        self._catalog[key] = {"commands": deepcopy(commands), "validated": time.time()}
+        self._store.async_delay_save(lambda: self._catalog, SNAPSHOT_SAVE_DELAY)
+        return changed
@@ -25,8 +25,10 @@ from homeassistant.helpers.typing import HomeAssistantType
 from pyhon.appliance import HonAppliance
 from pyhon.parameter.range import HonParameterRange
 
-from .const import HON_HVAC_MODE, HON_FAN, DOMAIN, HON_HVAC_PROGRAM
+from .const import HON_HVAC_MODE, HON_FAN, HON_HVAC_PROGRAM
+from .discovery import HonApplianceIndex, get_plan
 from .hon import HonEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -103,25 +105,26 @@ CLIMATES: dict[
 }
 
 
+def discover(index: HonApplianceIndex, description: ClimateEntityDescription) -> bool:
+    if isinstance(description, HonACClimateEntityDescription):
+        return index.has_command(description.key)
+    return index.has_setting(description.key)
+
+
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     entities = []
     entity: HonClimateEntity | HonACClimateEntity
-    for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in CLIMATES.get(device.appliance_type, []):
-            if isinstance(description, HonACClimateEntityDescription):
-                if description.key not in list(device.commands):
-                    continue
-                entity = HonACClimateEntity(hass, entry, device, description)
-            elif isinstance(description, HonClimateEntityDescription):
-                if description.key not in device.available_settings:
-                    continue
-                entity = HonClimateEntity(hass, entry, device, description)
-            else:
-                continue  # type: ignore[unreachable]
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
+    for device, description in get_plan(hass, entry, "climate"):
+        if isinstance(description, HonACClimateEntityDescription):
+            entity = HonACClimateEntity(hass, entry, device, description)
+        elif isinstance(description, HonClimateEntityDescription):
+            entity = HonClimateEntity(hass, entry, device, description)
+        else:
+            continue
+        entities.append(entity)
     async_add_entities(entities)
 
 
@@ -183,7 +186,7 @@ class HonACClimateEntity(HonEntity, ClimateEntity):
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
         self._device.settings["settings.tempSel"].value = str(int(temperature))
-        await self._device.commands["settings"].send()
+        await self.coordinator.async_send_command("settings")
         self.async_write_ha_state()
 
     @property
@@ -196,7 +199,7 @@ class HonACClimateEntity(HonEntity, ClimateEntity):
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         self._attr_hvac_mode = hvac_mode
         if hvac_mode == HVACMode.OFF:
-            await self._device.commands["stopProgram"].send()
+            await self.coordinator.async_send_command("stopProgram")
             self._device.sync_command("stopProgram", "settings")
         else:
             self._device.settings["settings.onOffStatus"].value = "1"
@@ -207,7 +210,7 @@ class HonACClimateEntity(HonEntity, ClimateEntity):
             else:
                 await self.async_set_preset_mode(HON_HVAC_PROGRAM[hvac_mode])
                 return
-            await self._device.commands["settings"].send()
+            await self.coordinator.async_send_command("settings")
         self.async_write_ha_state()
 
     @property
@@ -224,7 +227,7 @@ class HonACClimateEntity(HonEntity, ClimateEntity):
         self._handle_coordinator_update(update=False)
         await self.coordinator.async_refresh()
         self._attr_preset_mode = preset_mode
-        await self._device.commands["startProgram"].send()
+        await self.coordinator.async_send_command("startProgram")
         self.async_write_ha_state()
 
     @property
@@ -246,7 +249,7 @@ class HonACClimateEntity(HonEntity, ClimateEntity):
             fan_modes[HON_FAN[int(mode)]] = mode
         self._device.settings["settings.windSpeed"].value = str(fan_modes[fan_mode])
         self._attr_fan_mode = fan_mode
-        await self._device.commands["settings"].send()
+        await self.coordinator.async_send_command("settings")
         self.async_write_ha_state()
 
     @property
@@ -274,7 +277,7 @@ class HonACClimateEntity(HonEntity, ClimateEntity):
         if swing_mode in [SWING_OFF, SWING_VERTICAL] and horizontal.value == "7":
             horizontal.value = "0"
         self._attr_swing_mode = swing_mode
-        await self._device.commands["settings"].send()
+        await self.coordinator.async_send_command("settings")
         self.async_write_ha_state()
 
     @callback
@@ -342,7 +345,7 @@ class HonClimateEntity(HonEntity, ClimateEntity):
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
         self._device.settings[self.entity_description.key].value = str(int(temperature))
-        await self._device.commands["settings"].send()
+        await self.coordinator.async_send_command("settings")
         self.async_write_ha_state()
 
     @property
@@ -356,9 +359,9 @@ class HonClimateEntity(HonEntity, ClimateEntity):
         if len(self.hvac_modes) <= 1:
             return
         if hvac_mode == HVACMode.OFF:
-            await self._device.commands["stopProgram"].send()
+            await self.coordinator.async_send_command("stopProgram")
         else:
-            await self._device.commands["startProgram"].send()
+            await self.coordinator.async_send_command("startProgram")
         self._attr_hvac_mode = hvac_mode
         self.async_write_ha_state()
 
@@ -390,7 +393,7 @@ class HonClimateEntity(HonEntity, ClimateEntity):
         self._set_temperature_bound()
         self._attr_preset_mode = preset_mode
         await self.coordinator.async_refresh()
-        await self._device.commands[command].send()
+        await self.coordinator.async_send_command(command)
         self.async_write_ha_state()
 
     def _set_temperature_bound(self) -> None:
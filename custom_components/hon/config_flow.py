@@ -1,12 +1,26 @@
+import asyncio
 import logging
 from typing import Any
 
 import voluptuous as vol  # type: ignore[import-untyped]
+from aiohttp import ClientError
 from homeassistant import config_entries
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import aiohttp_client
+from pyhon import HonAPI
+from pyhon.appliance import HonAppliance
+from pyhon.exceptions import HonAuthenticationError
 
-from .const import DOMAIN
+from .const import (
+    APPLIANCES,
+    CONF_APPLIANCE_INTERVALS,
+    CONF_TYPE_INTERVALS,
+    DOMAIN,
+    MIN_UPDATE_INTERVAL,
+    SETUP_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,36 +36,129 @@ class HonFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        if user_input is None:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema(
-                    {vol.Required(CONF_EMAIL): str, vol.Required(CONF_PASSWORD): str}
-                ),
-            )
-
-        self._email = user_input[CONF_EMAIL]
-        self._password = user_input[CONF_PASSWORD]
-
-        if self._email is None or self._password is None:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema(
-                    {vol.Required(CONF_EMAIL): str, vol.Required(CONF_PASSWORD): str}
-                ),
-            )
-
-        # Check if already configured
-        await self.async_set_unique_id(self._email)
-        self._abort_if_unique_id_configured()
-
-        return self.async_create_entry(
-            title=self._email,
-            data={
-                CONF_EMAIL: self._email,
-                CONF_PASSWORD: self._password,
-            },
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self._email = user_input[CONF_EMAIL]
+            self._password = user_input[CONF_PASSWORD]
+
+            # Check if already configured
+            await self.async_set_unique_id(self._email)
+            self._abort_if_unique_id_configured()
+
+            try:
+                await self._async_login(self._email, self._password)
+            except HonAuthenticationError as error:
+                # pyhOn raises the same error when the login page is unreachable
+                if str(error) == "Can't open login page":
+                    errors["base"] = "cannot_connect"
+                else:
+                    errors["base"] = "invalid_auth"
+            except (ClientError, TimeoutError):
+                errors["base"] = "cannot_connect"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error while logging in to hOn")
+                errors["base"] = "unknown"
+            else:
+                return self.async_create_entry(
+                    title=self._email,
+                    data={
+                        CONF_EMAIL: self._email,
+                        CONF_PASSWORD: self._password,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_EMAIL, default=self._email or ""): str,
+                    vol.Required(CONF_PASSWORD): str,
+                }
+            ),
+            errors=errors,
         )
 
+    async def _async_login(self, email: str, password: str) -> None:
+        """Log in and keep the session for the first setup of the entry"""
+        session = aiohttp_client.async_get_clientsession(self.hass)
+        async with asyncio.timeout(SETUP_TIMEOUT):
+            api = await HonAPI(email, password, session=session).create()
+            appliances = await api.load_appliances()
+        sessions = self.hass.data.setdefault(DOMAIN, {}).setdefault("sessions", {})
+        sessions[email] = (api, appliances)
+
     async def async_step_import(self, user_input: dict[str, str]) -> FlowResult:
         return await self.async_step_user(user_input)
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "HonOptionsFlowHandler":
+        return HonOptionsFlowHandler(config_entry)
+
+
+def interval_field(key: str, value: int | None) -> vol.Optional:
+    return vol.Optional(key, description={"suggested_value": value})
+
+
+INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL))
+
+
+class HonOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
+    @property
+    def _appliances(self) -> list[HonAppliance]:
+        if (
+            hon := self.hass.data.get(DOMAIN, {}).get(self.config_entry.unique_id)
+        ) is None:
+            return []
+        appliances: list[HonAppliance] = hon.appliances
+        return appliances
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        types = sorted({appliance.appliance_type for appliance in self._appliances})
+        types = [code for code in types if code in APPLIANCES] or list(APPLIANCES)
+        if user_input is not None:
+            self.options[CONF_SCAN_INTERVAL] = user_input.get(CONF_SCAN_INTERVAL)
+            self.options[CONF_TYPE_INTERVALS] = {
+                code: user_input[code] for code in types if code in user_input
+            }
+            if not self._appliances:
+                return self.async_create_entry(title="", data=self.options)
+            return await self.async_step_appliances()
+
+        type_intervals = self.options.get(CONF_TYPE_INTERVALS, {})
+        schema = {
+            interval_field(
+                CONF_SCAN_INTERVAL, self.options.get(CONF_SCAN_INTERVAL)
+            ): INTERVAL_VALIDATOR
+        }
+        for code in types:
+            schema[interval_field(code, type_intervals.get(code))] = INTERVAL_VALIDATOR
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
+
+    async def async_step_appliances(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        appliances = {appliance.unique_id: appliance for appliance in self._appliances}
+        if user_input is not None:
+            self.options[CONF_APPLIANCE_INTERVALS] = {
+                key: value for key, value in user_input.items() if key in appliances
+            }
+            return self.async_create_entry(title="", data=self.options)
+
+        appliance_intervals = self.options.get(CONF_APPLIANCE_INTERVALS, {})
+        schema = {
+            interval_field(key, appliance_intervals.get(key)): INTERVAL_VALIDATOR
+            for key in appliances
+        }
+        names = "\n".join(
+            f"- {key}: {appliance.nick_name}" for key, appliance in appliances.items()
+        )
+        return self.async_show_form(
+            step_id="appliances",
+            data_schema=vol.Schema(schema),
+            description_placeholders={"appliances": names},
+        )
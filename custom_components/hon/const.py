@@ -8,19 +8,77 @@ from homeassistant.components.climate import (
 
 DOMAIN: str = "hon"
 UPDATE_INTERVAL: int = 60
+MIN_UPDATE_INTERVAL: int = 10
 
-PLATFORMS: list[str] = [
-    "sensor",
-    "select",
-    "number",
-    "switch",
-    "button",
-    "binary_sensor",
-    "climate",
-    "fan",
-    "light",
-    "lock",
-]
+CONF_TYPE_INTERVALS: str = "type_intervals"
+CONF_APPLIANCE_INTERVALS: str = "appliance_intervals"
+POLL_CONCURRENCY: int = 4
+POLL_SLACK: int = 5
+POLL_TIMEOUT: int = 20
+POLL_JITTER: int = 2
+REFRESH_COALESCE_WINDOW: float = 1
+DEADLINE_MARGIN: int = 15
+CONVERGE_DELAYS: list[int] = [2, 4, 8, 15, 30]
+HIBERNATE_AFTER: int = 900
+HIBERNATE_INTERVAL: int = 1800
+BUDGET_CAPACITY: int = 60
+BUDGET_RATE: float = 0.5
+BUDGET_RESERVE: int = 10
+BUDGET_STRETCH: int = 3
+BREAKER_THRESHOLD: int = 3
+BREAKER_BACKOFF: int = 30
+BREAKER_BACKOFF_MAX: int = 1800
+BREAKER_PROBE_WAIT: int = 5
+RECONNECT_BACKOFF: int = 10
+SETUP_TIMEOUT: int = 30
+STORAGE_VERSION: int = 1
+SNAPSHOT_SAVE_DELAY: int = 30
+CATALOG_REVALIDATE: int = 86400
+
+# Poll intervals in seconds per appliance type (while running, while idle)
+# Program appliances poll slowly while running, the deadlines catch start and end
+POLL_INTERVALS: dict[str, tuple[int, int]] = {
+    "AC": (60, 120),
+    "AP": (60, 120),
+    "AS": (120, 300),
+    "DW": (180, 300),
+    "HO": (30, 120),
+    "IH": (15, 300),
+    "MW": (15, 300),
+    "OV": (30, 300),
+    "REF": (120, 300),
+    "RVC": (30, 300),
+    "TD": (180, 300),
+    "WC": (120, 300),
+    "WD": (180, 300),
+    "WH": (120, 300),
+    "WM": (180, 300),
+}
+
+# Refresh intervals in seconds of slowly changing appliance data
+TIER_INTERVALS: dict[str, int] = {
+    "statistics": 1800,
+    "maintenance": 21600,
+}
+
+# Appliance types which report their program state in machMode
+PROGRAM_APPLIANCES: list[str] = ["DW", "TD", "WD", "WM"]
+RUNNING_MACH_MODES: list[int] = [2, 3, 9]
+SCHEDULED_MACH_MODES: list[int] = [4, 5]
+
+# Entity description table of each platform, keyed by appliance type
+PLATFORM_DESCRIPTIONS: dict[str, str] = {
+    "sensor": "SENSORS",
+    "select": "SELECTS",
+    "number": "NUMBERS",
+    "switch": "SWITCHES",
+    "button": "BUTTONS",
+    "binary_sensor": "BINARY_SENSORS",
+    "climate": "CLIMATES",
+    "fan": "FANS",
+    "light": "LIGHTS",
+    "lock": "LOCKS",
+}
 
 APPLIANCES: dict[str, str] = {
     "AC": "Air Conditioner",
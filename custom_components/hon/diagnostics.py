@@ -0,0 +1,30 @@
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.typing import HomeAssistantType
+
+from .const import DOMAIN
+from .poller import HonPoller
+from .profiler import get_profiler
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistantType, entry: ConfigEntry
+) -> dict[str, Any]:
+    poller: HonPoller = hass.data[DOMAIN]["pollers"][entry.unique_id]
+    return {
+        "setup": get_profiler(hass, entry).diagnostics,
+        "breaker": poller.breaker.diagnostics,
+        "budget": poller.budget.diagnostics,
+        "appliances": {
+            coordinator.device.nick_name: {
+                "availability": coordinator.availability,
+                "stale": coordinator.stale,
+                "hibernating": coordinator.device.unique_id in poller.hibernating,
+                "timeouts": coordinator.timeouts,
+                "writes": coordinator.writes,
+                "unchanged_writes": coordinator.unchanged_writes,
+            }
+            for coordinator in poller.coordinators.values()
+        },
+    }
@@ -0,0 +1,73 @@
+import importlib
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.typing import HomeAssistantType
+from pyhon.appliance import HonAppliance
+
+from .const import DOMAIN, PLATFORM_DESCRIPTIONS
+from .typedefs import HonEntityDescription
+
+
+class HonApplianceIndex:
+    """Attribute keys, settings and commands of one appliance, scanned once."""
+
+    def __init__(self, appliance: HonAppliance) -> None:
+        self._appliance = appliance
+        self._settings: set[str] = set(appliance.available_settings)
+        self._commands: set[str] = set(appliance.commands)
+        self._attributes: dict[str, bool] = {}
+
+    @property
+    def appliance(self) -> HonAppliance:
+        return self._appliance
+
+    def has_attribute(self, key: str) -> bool:
+        if (found := self._attributes.get(key)) is None:
+            found = self._attributes[key] = self._appliance.get(key) is not None
+        return found
+
+    def has_setting(self, key: str) -> bool:
+        return key in self._settings
+
+    def has_command(self, key: str) -> bool:
+        return key in self._commands
+
+
+Plan = list[tuple[HonAppliance, HonEntityDescription]]
+
+
+class HonDiscovery:
+    """Entity plans of all platforms, built from one scan of the appliances."""
+
+    def __init__(self, appliances: list[HonAppliance]) -> None:
+        self._plans: dict[str, Plan] = {}
+        indexes = [HonApplianceIndex(appliance) for appliance in appliances]
+        for platform, descriptions in PLATFORM_DESCRIPTIONS.items():
+            module = importlib.import_module(f"{__package__}.{platform}")
+            table: dict[str, tuple[Any, ...]] = getattr(module, descriptions)
+            discover: Callable[[HonApplianceIndex, Any], bool] = module.discover
+            self._plans[platform] = [
+                (index.appliance, description)
+                for index in indexes
+                for description in table.get(index.appliance.appliance_type, ())
+                if discover(index, description)
+            ]
+        self._platforms = [
+            platform
+            for platform, plan in self._plans.items()
+            if plan or (platform == "button" and appliances)
+        ]
+
+    @property
+    def platforms(self) -> list[str]:
+        """Platforms with any entity, buttons exist for every appliance"""
+        return self._platforms
+
+    def plan(self, platform: str) -> Plan:
+        return self._plans.get(platform, [])
+
+
+def get_plan(hass: HomeAssistantType, entry: ConfigEntry, platform: str) -> Plan:
+    discovery: HonDiscovery = hass.data[DOMAIN]["discovery"][entry.unique_id]
+    return discovery.plan(platform)
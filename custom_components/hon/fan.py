@@ -18,8 +18,9 @@ from homeassistant.util.percentage import (
 from pyhon.appliance import HonAppliance
 from pyhon.parameter.range import HonParameterRange
 
-from .const import DOMAIN
+from .discovery import HonApplianceIndex, get_plan
 from .hon import HonEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,20 +36,21 @@ FANS: dict[str, tuple[FanEntityDescription, ...]] = {
 }
 
 
+def discover(index: HonApplianceIndex, description: FanEntityDescription) -> bool:
+    return index.has_setting(description.key) and index.has_attribute(
+        description.key.split(".")[-1]
+    )
+
+
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    entities = []
-    for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in FANS.get(device.appliance_type, []):
-            if (
-                description.key not in device.available_settings
-                or device.get(description.key.split(".")[-1]) is None
-            ):
-                continue
-            entity = HonFanEntity(hass, entry, device, description)
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
+    entities = [
+        HonFanEntity(hass, entry, device, description)
+        for device, description in get_plan(hass, entry, "fan")
+        if isinstance(description, FanEntityDescription)
+    ]
     async_add_entities(entities)
 
 
@@ -85,7 +87,7 @@ class HonFanEntity(HonEntity, FanEntity):
         """Set the speed percentage of the fan."""
         mode = math.ceil(percentage_to_ranged_value(self._speed_range, percentage))
         self._device.settings[self.entity_description.key].value = mode
-        await self._device.commands[self._command].send()
+        await self.coordinator.async_send_command(self._command)
         self.async_write_ha_state()
 
     @property
@@ -112,7 +114,7 @@ class HonFanEntity(HonEntity, FanEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         self._device.settings[self.entity_description.key].value = 0
-        await self._device.commands[self._command].send()
+        await self.coordinator.async_send_command(self._command)
         self.async_write_ha_state()
 
     @callback
@@ -1,69 +1,240 @@
+import asyncio
 import json
 import logging
+from collections.abc import Callable, Iterator, Mapping
 from contextlib import suppress
-from datetime import timedelta
+from copy import deepcopy
+from enum import StrEnum
+from functools import cache, cached_property
+from importlib.metadata import version
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 
-import pkg_resources  # type: ignore[import, unused-ignore]
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pyhon.appliance import HonAppliance
+from pyhon.typedefs import Parameter
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import (
+    DEADLINE_MARGIN,
+    DOMAIN,
+    POLL_INTERVALS,
+    PROGRAM_APPLIANCES,
+    REFRESH_COALESCE_WINDOW,
+    RUNNING_MACH_MODES,
+    SCHEDULED_MACH_MODES,
+    UPDATE_INTERVAL,
+)
 from .typedefs import HonEntityDescription, HonOptionEntityDescription, T
 
+if TYPE_CHECKING:
+    from .poller import HonPoller
+
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
 
-class HonInfo:
-    def __init__(self) -> None:
-        self._manifest: dict[str, Any] = self._get_manifest()
-        self._hon_version: str = self._manifest.get("version", "")
-        self._pyhon_version: str = pkg_resources.get_distribution("pyhon").version
 
-    @staticmethod
-    def _get_manifest() -> dict[str, Any]:
+class HonInfo:
+    @cached_property
+    def manifest(self) -> dict[str, Any]:
         manifest = Path(__file__).parent / "manifest.json"
         with open(manifest, "r", encoding="utf-8") as file:
             result: dict[str, Any] = json.loads(file.read())
         return result
 
-    @property
-    def manifest(self) -> dict[str, Any]:
-        return self._manifest
-
     @property
     def hon_version(self) -> str:
-        return self._hon_version
+        return str(self.manifest.get("version", ""))
 
-    @property
+    @cached_property
     def pyhon_version(self) -> str:
-        return self._pyhon_version
+        return version("pyhon")
+
+
+@cache
+def get_info() -> HonInfo:
+    return HonInfo()
+
+
+class HonAvailability(StrEnum):
+    """Why an appliance is available or not, in order of precedence"""
+
+    UPDATE_FAILED = "update_failed"
+    DISCONNECTED = "disconnected"
+    REMOTE_CONTROL_OFF = "remote_control_off"
+    AVAILABLE = "available"
 
 
 class HonCoordinator(DataUpdateCoordinator[None]):
-    def __init__(self, hass: HomeAssistantType, device: HonAppliance):
+    def __init__(
+        self, hass: HomeAssistantType, device: HonAppliance, poller: "HonPoller"
+    ):
         """Initialize my coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=device.unique_id,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
-        )
+        super().__init__(hass, _LOGGER, name=device.unique_id)
         self._device = device
-        self._info = HonInfo()
+        self._poller = poller
+        self._pending_refresh: asyncio.Task[None] | None = None
+        self._states: dict[str, Any] = {}
+        self._status: tuple[HonAvailability, bool] | None = None
+        self.availability = self._availability()
+        self.stale: bool = False
+        self.timeouts: int = 0
+        self.writes: int = 0
+        self.unchanged_writes: int = 0
 
     async def _async_update_data(self) -> None:
-        return await self._device.update()
+        return await self._poller.async_refresh(self._device)
+
+    async def async_refresh(self) -> None:
+        """Merge all refresh requests of a short window into one poll"""
+        if self._pending_refresh is None:
+            self._pending_refresh = self.hass.async_create_task(
+                self._async_coalesced_refresh()
+            )
+        await asyncio.shield(self._pending_refresh)
+
+    async def _async_coalesced_refresh(self) -> None:
+        await asyncio.sleep(REFRESH_COALESCE_WINDOW)
+        self._pending_refresh = None
+        await super().async_refresh()
+
+    async def async_send_command(self, name: str) -> bool:
+        if self.restored:
+            raise HomeAssistantError("Not connected to hOn yet")
+        command = self._device.commands[name]
+        self._poller.async_wake(self._device)
+        await self._poller.budget.acquire()
+        breaker = self._poller.breaker
+        if not breaker.allow():
+            raise HomeAssistantError(
+                f"Requests paused for {breaker.retry_in:.0f} s after failures"
+            )
+        try:
+            result = await command.send()
+        except Exception:
+            breaker.failure()
+            raise
+        else:
+            breaker.success()
+        finally:
+            breaker.release()
+        parameters = self._device.attributes.get("parameters", {})
+        targets = {
+            key: str(parameter.value)
+            for key, parameter in command.parameters.items()
+            if key in parameters
+        }
+        self._poller.async_converge(self._device, targets)
+        return result
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call back only the entities whose watched keys changed"""
+        self.availability = self._availability()
+        status = (self.availability, self.restored)
+        watched: set[str] = set()
+        for _, context in self._listeners.values():
+            if isinstance(context, frozenset):
+                watched.update(context)
+        settings = self._device.settings
+        states = {key: self._key_state(key, settings) for key in watched}
+        changed = {
+            key
+            for key, state in states.items()
+            if self._states.get(key, _MISSING) != state
+        }
+        everyone = status != self._status
+        self._states, self._status = states, status
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                everyone
+                or not isinstance(context, frozenset)
+                or not changed.isdisjoint(context)
+            ):
+                update_callback()
+
+    def _availability(self) -> HonAvailability:
+        if not self.last_update_success:
+            return HonAvailability.UPDATE_FAILED
+        if self.disconnected:
+            return HonAvailability.DISCONNECTED
+        if get_int(self._device.get("remoteCtrValid")) not in (None, 1):
+            return HonAvailability.REMOTE_CONTROL_OFF
+        return HonAvailability.AVAILABLE
+
+    def _key_state(self, key: str, settings: dict[str, Parameter]) -> Any:
+        if (setting := settings.get(key)) is not None:
+            return setting.value, tuple(setting.values)
+        return deepcopy(self._device.get(key))
+
+    @callback
+    def async_set_stale(self) -> None:
+        """Keep the last known state after a poll timed out"""
+        self.stale = True
+        self.timeouts += 1
+        _LOGGER.warning(
+            "%s - Poll timed out (%s times), keeping last state",
+            self._device.nick_name,
+            self.timeouts,
+        )
+
+    @property
+    def disconnected(self) -> bool:
+        category = self._device.get("attributes.lastConnEvent.category")
+        return bool(category == "DISCONNECTED")
+
+    @property
+    def device(self) -> HonAppliance:
+        return self._device
+
+    @property
+    def restored(self) -> bool:
+        return self._poller.restored
+
+    def _program_state(self, modes: list[int]) -> bool | None:
+        if self._device.appliance_type not in PROGRAM_APPLIANCES:
+            return None
+        if (mode := get_int(self._device.get("machMode"))) is None:
+            return None
+        return mode in modes
+
+    @property
+    def running(self) -> bool:
+        if (running := self._program_state(RUNNING_MACH_MODES)) is not None:
+            return running
+        if (status := get_int(self._device.get("onOffStatus"))) is not None:
+            return status == 1
+        return bool(get_int(self._device.get("prPhase")))
+
+    @property
+    def poll_interval(self) -> int:
+        running, idle = POLL_INTERVALS.get(
+            self._device.appliance_type, (UPDATE_INTERVAL, UPDATE_INTERVAL)
+        )
+        if (interval := self._poller.configured_interval(self._device)) is not None:
+            running, idle = min(running, interval), interval
+        return running if self.running else idle
+
+    @property
+    def deadline(self) -> int | None:
+        """Seconds until the predicted program start or end"""
+        if not (self.running or self._program_state(SCHEDULED_MACH_MODES)):
+            return None
+        if delay_time := get_int(self._device.get("delayTime")):
+            return max(delay_time * 60 - DEADLINE_MARGIN, 0)
+        if remaining_time := get_int(self._device.get("remainingTimeMM")):
+            return remaining_time * 60 + DEADLINE_MARGIN
+        return None
 
     @property
     def info(self) -> HonInfo:
-        return self._info
+        return get_info()
 
 
 class HonEntity(CoordinatorEntity[HonCoordinator]):
@@ -76,7 +247,7 @@ class HonEntity(CoordinatorEntity[HonCoordinator]):
         device: HonAppliance,
         description: Optional[HonEntityDescription] = None,
     ) -> None:
-        coordinator = get_coordinator(hass, device)
+        coordinator = get_coordinator(hass, entry, device)
         super().__init__(coordinator)
 
         self._hon = hass.data[DOMAIN][entry.unique_id]
@@ -89,6 +260,8 @@ class HonEntity(CoordinatorEntity[HonCoordinator]):
             self._attr_unique_id = f"{self._device.unique_id}{description.key}"
         else:
             self._attr_unique_id = self._device.unique_id
+        if (keys := self.watched_keys()) is not None:
+            self.coordinator_context = frozenset(keys)
         self._handle_coordinator_update(update=False)
 
     @property
@@ -101,12 +274,73 @@ class HonEntity(CoordinatorEntity[HonCoordinator]):
             sw_version=self._device.get("fwVersion", ""),
         )
 
+    @property
+    def available(self) -> bool:
+        return self._coordinator.availability != HonAvailability.UPDATE_FAILED
+
+    @property
+    def controllable(self) -> bool:
+        """Appliance is connected and accepts remote commands"""
+        return self._coordinator.availability == HonAvailability.AVAILABLE
+
+    @property
+    def assumed_state(self) -> bool:
+        """State comes from the snapshot until the cloud is reachable"""
+        return self._coordinator.restored
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Count the writes which changed the state and those which did not"""
+        previous = self.hass.states.get(self.entity_id)
+        super().async_write_ha_state()
+        # StateMachine.async_set (HA 2024.1) keeps the State of an unchanged write
+        if self.hass.states.get(self.entity_id) is previous:
+            self._coordinator.unchanged_writes += 1
+        else:
+            self._coordinator.writes += 1
+
+    def watched_keys(self) -> set[str] | None:
+        """Keys the state is read from, None to update on every refresh"""
+        return None
+
     @callback
     def _handle_coordinator_update(self, update: bool = True) -> None:
         if update:
             self.async_write_ha_state()
 
 
+class HonDescriptions(Mapping[str, tuple[T, ...]]):
+    """Entity descriptions per appliance type, built on first use"""
+
+    def __init__(self, factories: dict[str, Callable[[], tuple[T, ...]]]) -> None:
+        self._factories: dict[str, Callable[[], tuple[T, ...]]] = factories
+        self._descriptions: dict[str, tuple[T, ...]] = {}
+
+    def __getitem__(self, appliance_type: str) -> tuple[T, ...]:
+        if (descriptions := self._descriptions.get(appliance_type)) is None:
+            descriptions = self._factories[appliance_type]()
+            self._descriptions[appliance_type] = descriptions
+        return descriptions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def merge(self, appliance_type: str, *others: str) -> None:
+        """Extend the descriptions of a type by those of other types"""
+        base = self._factories.get(appliance_type)
+
+        def merged() -> tuple[T, ...]:
+            result: tuple[T, ...] = base() if base else ()
+            for other in others:
+                result = unique_entities(result, self[other])
+            return result
+
+        self._factories[appliance_type] = merged
+
+
 def unique_entities(
     base_entities: tuple[T, ...],
     new_entities: tuple[T, ...],
@@ -120,16 +354,17 @@ def unique_entities(
     return tuple(result)
 
 
-def get_coordinator(hass: HomeAssistantType, appliance: HonAppliance) -> HonCoordinator:
-    coordinators = hass.data[DOMAIN]["coordinators"]
-    if appliance.unique_id in coordinators:
-        coordinator: HonCoordinator = hass.data[DOMAIN]["coordinators"][
-            appliance.unique_id
-        ]
-    else:
-        coordinator = HonCoordinator(hass, appliance)
-        hass.data[DOMAIN]["coordinators"][appliance.unique_id] = coordinator
-    return coordinator
+def get_coordinator(
+    hass: HomeAssistantType, entry: ConfigEntry, appliance: HonAppliance
+) -> HonCoordinator:
+    poller: HonPoller = hass.data[DOMAIN]["pollers"][entry.unique_id]
+    return poller.get_coordinator(appliance)
+
+
+def get_int(value: Any) -> int | None:
+    with suppress(TypeError, ValueError):
+        return int(value)
+    return None
 
 
 def get_readable(
@@ -14,8 +14,9 @@ from homeassistant.helpers.typing import HomeAssistantType
 from pyhon.appliance import HonAppliance
 from pyhon.parameter.range import HonParameterRange
 
-from .const import DOMAIN
+from .discovery import HonApplianceIndex, get_plan
 from .hon import HonEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,20 +46,21 @@ LIGHTS: dict[str, tuple[LightEntityDescription, ...]] = {
 }
 
 
+def discover(index: HonApplianceIndex, description: LightEntityDescription) -> bool:
+    return index.has_setting(description.key) and index.has_attribute(
+        description.key.split(".")[-1]
+    )
+
+
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    entities = []
-    for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in LIGHTS.get(device.appliance_type, []):
-            if (
-                description.key not in device.available_settings
-                or device.get(description.key.split(".")[-1]) is None
-            ):
-                continue
-            entity = HonLightEntity(hass, entry, device, description)
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
+    entities = [
+        HonLightEntity(hass, entry, device, description)
+        for device, description in get_plan(hass, entry, "light")
+        if isinstance(description, LightEntityDescription)
+    ]
     async_add_entities(entities)
 
 
@@ -103,7 +105,7 @@ class HonLightEntity(HonEntity, LightEntity):
             self._attr_brightness = self.brightness
         else:
             light.value = light.max
-        await self._device.commands[self._command].send()
+        await self.coordinator.async_send_command(self._command)
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -112,7 +114,7 @@ class HonLightEntity(HonEntity, LightEntity):
         if not isinstance(light, HonParameterRange):
             raise ValueError()
         light.value = light.min
-        await self._device.commands[self._command].send()
+        await self.coordinator.async_send_command(self._command)
         self.async_write_ha_state()
 
     @property
@@ -9,8 +9,9 @@ from homeassistant.helpers.typing import HomeAssistantType
 from pyhon.parameter.base import HonParameter
 from pyhon.parameter.range import HonParameterRange
 
-from .const import DOMAIN
+from .discovery import HonApplianceIndex, get_plan
 from .hon import HonEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,27 +26,29 @@ LOCKS: dict[str, tuple[LockEntityDescription, ...]] = {
 }
 
 
+def discover(index: HonApplianceIndex, description: LockEntityDescription) -> bool:
+    return index.has_setting(f"settings.{description.key}") and index.has_attribute(
+        description.key
+    )
+
+
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    entities = []
-    for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in LOCKS.get(device.appliance_type, []):
-            if (
-                f"settings.{description.key}" not in device.available_settings
-                or device.get(description.key) is None
-            ):
-                continue
-            entity = HonLockEntity(hass, entry, device, description)
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
-
+    entities = [
+        HonLockEntity(hass, entry, device, description)
+        for device, description in get_plan(hass, entry, "lock")
+    ]
     async_add_entities(entities)
 
 
 class HonLockEntity(HonEntity, LockEntity):
     entity_description: LockEntityDescription
 
+    def watched_keys(self) -> set[str]:
+        return {self.entity_description.key}
+
     @property
     def is_locked(self) -> bool | None:
         """Return a boolean for the state of the lock."""
@@ -58,7 +61,7 @@ class HonLockEntity(HonEntity, LockEntity):
             return
         setting.value = setting.max if isinstance(setting, HonParameterRange) else 1
         self.async_write_ha_state()
-        await self._device.commands["settings"].send()
+        await self.coordinator.async_send_command("settings")
         await self.coordinator.async_refresh()
 
     async def async_unlock(self, **kwargs: Any) -> None:
@@ -68,17 +71,13 @@ class HonLockEntity(HonEntity, LockEntity):
             return
         setting.value = setting.min if isinstance(setting, HonParameterRange) else 0
         self.async_write_ha_state()
-        await self._device.commands["settings"].send()
+        await self.coordinator.async_send_command("settings")
         await self.coordinator.async_refresh()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and int(self._device.get("remoteCtrValid", 1)) == 1
-            and self._device.get("attributes.lastConnEvent.category") != "DISCONNECTED"
-        )
+        return self.controllable
 
     @callback
     def _handle_coordinator_update(self, update: bool = True) -> None:
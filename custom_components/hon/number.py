@@ -15,8 +15,9 @@ from homeassistant.helpers.typing import HomeAssistantType
 from pyhon.appliance import HonAppliance
 from pyhon.parameter.range import HonParameterRange
 
-from .const import DOMAIN
-from .hon import HonEntity, unique_entities
+from .discovery import HonApplianceIndex, get_plan
+from .hon import HonEntity, HonDescriptions
+from .profiler import profile_platform
 
 
 @dataclass(frozen=True)
@@ -29,199 +30,205 @@ class HonNumberEntityDescription(NumberEntityDescription):
     pass
 
 
-NUMBERS: dict[str, tuple[NumberEntityDescription, ...]] = {
-    "WM": (
-        HonConfigNumberEntityDescription(
-            key="startProgram.delayTime",
-            name="Delay Time",
-            icon="mdi:timer-plus",
-            native_unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="delay_time",
+NUMBERS: HonDescriptions[NumberEntityDescription] = HonDescriptions(
+    {
+        "WM": lambda: (
+            HonConfigNumberEntityDescription(
+                key="startProgram.delayTime",
+                name="Delay Time",
+                icon="mdi:timer-plus",
+                native_unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="delay_time",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.rinseIterations",
+                name="Rinse Iterations",
+                icon="mdi:rotate-right",
+                translation_key="rinse_iterations",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.mainWashTime",
+                name="Main Wash Time",
+                icon="mdi:clock-start",
+                native_unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="wash_time",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.waterHard",
+                name="Water hard",
+                icon="mdi:water",
+                translation_key="water_hard",
+            ),
+            HonNumberEntityDescription(
+                key="settings.waterHard",
+                name="Water hard",
+                icon="mdi:water",
+                translation_key="water_hard",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.lang",
+                name="lang",
+            ),
         ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.rinseIterations",
-            name="Rinse Iterations",
-            icon="mdi:rotate-right",
-            translation_key="rinse_iterations",
+        "TD": lambda: (
+            HonConfigNumberEntityDescription(
+                key="startProgram.delayTime",
+                name="Delay time",
+                icon="mdi:timer-plus",
+                native_unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="delay_time",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.tempLevel",
+                name="Temperature level",
+                icon="mdi:thermometer",
+                translation_key="tumbledryertemplevel",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.dryTime",
+                name="Dry Time",
+                translation_key="dry_time",
+            ),
         ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.mainWashTime",
-            name="Main Wash Time",
-            icon="mdi:clock-start",
-            native_unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="wash_time",
+        "OV": lambda: (
+            HonConfigNumberEntityDescription(
+                key="startProgram.delayTime",
+                name="Delay time",
+                icon="mdi:timer-plus",
+                native_unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="delay_time",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.tempSel",
+                name="Target Temperature",
+                icon="mdi:thermometer",
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="target_temperature",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.prTime",
+                name="Program Duration",
+                icon="mdi:timelapse",
+                native_unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="program_duration",
+            ),
         ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.waterHard",
-            name="Water hard",
-            icon="mdi:water",
-            translation_key="water_hard",
+        "IH": lambda: (
+            HonConfigNumberEntityDescription(
+                key="startProgram.temp",
+                name="Temperature",
+                icon="mdi:thermometer",
+                translation_key="temperature",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.powerManagement",
+                name="Power Management",
+                icon="mdi:timelapse",
+                translation_key="power_management",
+            ),
         ),
-        HonNumberEntityDescription(
-            key="settings.waterHard",
-            name="Water hard",
-            icon="mdi:water",
-            translation_key="water_hard",
+        "DW": lambda: (
+            HonConfigNumberEntityDescription(
+                key="startProgram.delayTime",
+                name="Delay time",
+                icon="mdi:timer-plus",
+                native_unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="delay_time",
+            ),
+            HonConfigNumberEntityDescription(
+                key="startProgram.waterHard",
+                name="Water hard",
+                icon="mdi:water",
+                translation_key="water_hard",
+            ),
         ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.lang",
-            name="lang",
+        "AC": lambda: (
+            HonNumberEntityDescription(
+                key="settings.tempSel",
+                name="Target Temperature",
+                icon="mdi:thermometer",
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="target_temperature",
+            ),
         ),
-    ),
-    "TD": (
-        HonConfigNumberEntityDescription(
-            key="startProgram.delayTime",
-            name="Delay time",
-            icon="mdi:timer-plus",
-            native_unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="delay_time",
+        "REF": lambda: (
+            HonNumberEntityDescription(
+                key="settings.tempSelZ1",
+                name="Fridge Temperature",
+                icon="mdi:thermometer",
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="fridge_temp_sel",
+            ),
+            HonNumberEntityDescription(
+                key="settings.tempSelZ2",
+                name="Freezer Temperature",
+                icon="mdi:thermometer",
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="freezer_temp_sel",
+            ),
+            HonNumberEntityDescription(
+                key="settings.tempSelZ3",
+                name="MyZone Temperature",
+                icon="mdi:thermometer",
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="my_zone_temp_sel",
+            ),
         ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.tempLevel",
-            name="Temperature level",
-            icon="mdi:thermometer",
-            translation_key="tumbledryertemplevel",
+        "AP": lambda: (
+            HonNumberEntityDescription(
+                key="settings.aromaTimeOn",
+                name="Aroma Time On",
+                icon="mdi:scent",
+                native_unit_of_measurement=UnitOfTime.SECONDS,
+                translation_key="aroma_time_on",
+            ),
+            HonNumberEntityDescription(
+                key="settings.aromaTimeOff",
+                name="Aroma Time Off",
+                icon="mdi:scent-off",
+                native_unit_of_measurement=UnitOfTime.SECONDS,
+                translation_key="aroma_time_off",
+            ),
+            HonNumberEntityDescription(
+                key="settings.pollenLevel",
+                name="Pollen Level",
+                icon="mdi:flower-pollen",
+                translation_key="pollen_level",
+            ),
         ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.dryTime",
-            name="Dry Time",
-            translation_key="dry_time",
-        ),
-    ),
-    "OV": (
-        HonConfigNumberEntityDescription(
-            key="startProgram.delayTime",
-            name="Delay time",
-            icon="mdi:timer-plus",
-            native_unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="delay_time",
-        ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.tempSel",
-            name="Target Temperature",
-            icon="mdi:thermometer",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="target_temperature",
-        ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.prTime",
-            name="Program Duration",
-            icon="mdi:timelapse",
-            native_unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="program_duration",
-        ),
-    ),
-    "IH": (
-        HonConfigNumberEntityDescription(
-            key="startProgram.temp",
-            name="Temperature",
-            icon="mdi:thermometer",
-            translation_key="temperature",
-        ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.powerManagement",
-            name="Power Management",
-            icon="mdi:timelapse",
-            translation_key="power_management",
-        ),
-    ),
-    "DW": (
-        HonConfigNumberEntityDescription(
-            key="startProgram.delayTime",
-            name="Delay time",
-            icon="mdi:timer-plus",
-            native_unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="delay_time",
-        ),
-        HonConfigNumberEntityDescription(
-            key="startProgram.waterHard",
-            name="Water hard",
-            icon="mdi:water",
-            translation_key="water_hard",
-        ),
-    ),
-    "AC": (
-        HonNumberEntityDescription(
-            key="settings.tempSel",
-            name="Target Temperature",
-            icon="mdi:thermometer",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="target_temperature",
-        ),
-    ),
-    "REF": (
-        HonNumberEntityDescription(
-            key="settings.tempSelZ1",
-            name="Fridge Temperature",
-            icon="mdi:thermometer",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="fridge_temp_sel",
-        ),
-        HonNumberEntityDescription(
-            key="settings.tempSelZ2",
-            name="Freezer Temperature",
-            icon="mdi:thermometer",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="freezer_temp_sel",
-        ),
-        HonNumberEntityDescription(
-            key="settings.tempSelZ3",
-            name="MyZone Temperature",
-            icon="mdi:thermometer",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="my_zone_temp_sel",
-        ),
-    ),
-    "AP": (
-        HonNumberEntityDescription(
-            key="settings.aromaTimeOn",
-            name="Aroma Time On",
-            icon="mdi:scent",
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            translation_key="aroma_time_on",
-        ),
-        HonNumberEntityDescription(
-            key="settings.aromaTimeOff",
-            name="Aroma Time Off",
-            icon="mdi:scent-off",
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            translation_key="aroma_time_off",
-        ),
-        HonNumberEntityDescription(
-            key="settings.pollenLevel",
-            name="Pollen Level",
-            icon="mdi:flower-pollen",
-            translation_key="pollen_level",
-        ),
-    ),
-}
+    }
+)
+
+NUMBERS.merge("WD", "WM", "TD")
+
 
-NUMBERS["WD"] = unique_entities(NUMBERS["WM"], NUMBERS["TD"])
+def discover(index: HonApplianceIndex, description: NumberEntityDescription) -> bool:
+    return index.has_setting(description.key)
 
 
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     entities = []
     entity: HonNumberEntity | HonConfigNumberEntity
-    for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in NUMBERS.get(device.appliance_type, []):
-            if description.key not in device.available_settings:
-                continue
-            if isinstance(description, HonNumberEntityDescription):
-                entity = HonNumberEntity(hass, entry, device, description)
-            elif isinstance(description, HonConfigNumberEntityDescription):
-                entity = HonConfigNumberEntity(hass, entry, device, description)
-            else:
-                continue
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
+    for device, description in get_plan(hass, entry, "number"):
+        if isinstance(description, HonNumberEntityDescription):
+            entity = HonNumberEntity(hass, entry, device, description)
+        elif isinstance(description, HonConfigNumberEntityDescription):
+            entity = HonConfigNumberEntity(hass, entry, device, description)
+        else:
+            continue
+        entities.append(entity)
     async_add_entities(entities)
 
 
 class HonNumberEntity(HonEntity, NumberEntity):
     entity_description: HonNumberEntityDescription
 
+    def watched_keys(self) -> set[str]:
+        return {self.entity_description.key, self.entity_description.key.split(".")[-1]}
+
     def __init__(
         self,
         hass: HomeAssistantType,
@@ -248,7 +255,7 @@ class HonNumberEntity(HonEntity, NumberEntity):
         if isinstance(setting, HonParameterRange):
             setting.value = value
         command = self.entity_description.key.split(".")[0]
-        await self._device.commands[command].send()
+        await self.coordinator.async_send_command(command)
         if command != "settings":
             self._device.sync_command(command, "settings")
         await self.coordinator.async_refresh()
@@ -267,16 +274,15 @@ class HonNumberEntity(HonEntity, NumberEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and int(self._device.get("remoteCtrValid", 1)) == 1
-            and self._device.get("attributes.lastConnEvent.category") != "DISCONNECTED"
-        )
+        return self.controllable
 
 
 class HonConfigNumberEntity(HonEntity, NumberEntity):
     entity_description: HonConfigNumberEntityDescription
 
+    def watched_keys(self) -> set[str]:
+        return {self.entity_description.key}
+
     def __init__(
         self,
         hass: HomeAssistantType,
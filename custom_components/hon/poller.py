@@ -0,0 +1,443 @@
+import asyncio
+import logging
+import random
+from collections.abc import Mapping
+from contextlib import suppress
+from datetime import datetime
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pyhon import Hon
+from pyhon.appliance import HonAppliance
+
+from .breaker import HonBreakerState, HonCircuitBreaker
+from .budget import HonRequestBudget
+from .const import (
+    BREAKER_BACKOFF_MAX,
+    BUDGET_STRETCH,
+    CONF_APPLIANCE_INTERVALS,
+    CONF_TYPE_INTERVALS,
+    CONVERGE_DELAYS,
+    HIBERNATE_AFTER,
+    HIBERNATE_INTERVAL,
+    POLL_CONCURRENCY,
+    POLL_JITTER,
+    POLL_SLACK,
+    POLL_TIMEOUT,
+    RECONNECT_BACKOFF,
+    TIER_INTERVALS,
+)
+from .hon import HonCoordinator
+from .profiler import HonSetupProfiler
+from .snapshot import HonSnapshotAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HonPhaseAllocator:
+    """Spread the poll phases of all appliances evenly over their interval."""
+
+    def __init__(self) -> None:
+        self._phases: dict[str, float] = {}
+
+    def _rebalance(self) -> None:
+        count = len(self._phases)
+        for index, key in enumerate(self._phases):
+            self._phases[key] = index / count
+
+    def add(self, key: str) -> None:
+        if key not in self._phases:
+            self._phases[key] = 0
+            self._rebalance()
+
+    def remove(self, key: str) -> None:
+        if self._phases.pop(key, None) is not None and self._phases:
+            self._rebalance()
+
+    def align(self, key: str, time: float, interval: float) -> float:
+        if (phase := self._phases.get(key)) is None or interval <= 0:
+            return time
+        jitter = min(POLL_JITTER, interval / len(self._phases) / 2)
+        offset = phase * interval + random.uniform(-jitter, jitter) - time % interval
+        return time + (offset + interval / 2) % interval - interval / 2
+
+
+class HonPoller:
+    """Refresh all appliances of one hOn account in a single scheduled cycle."""
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        entry: ConfigEntry,
+        hon: Hon,
+        api: HonSnapshotAPI,
+        phases: HonPhaseAllocator,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._hon = hon
+        self._api = api
+        self._phases = phases
+        self._options: Mapping[str, Any] = entry.options
+        self._breaker = HonCircuitBreaker(hon.email)
+        self._budget = HonRequestBudget()
+        self._semaphore = asyncio.Semaphore(POLL_CONCURRENCY)
+        self._unsub_poll: CALLBACK_TYPE | None = None
+        self._unsub_reconnect: CALLBACK_TYPE | None = None
+        self._reconnects: int = 0
+        self._coordinators: dict[str, HonCoordinator] = {}
+        self._next_poll: dict[str, float] = {}
+        self._tier_expires: dict[tuple[str, str], float] = {}
+        self._disconnected_since: dict[str, float] = {}
+        self._hibernating: set[str] = set()
+        self._converging: dict[str, tuple[dict[str, str], int]] = {}
+        self._reconcile_lock = asyncio.Lock()
+        self._reloading: bool = False
+        for appliance in hon.appliances:
+            self.get_coordinator(appliance)
+
+    @property
+    def breaker(self) -> HonCircuitBreaker:
+        return self._breaker
+
+    @property
+    def budget(self) -> HonRequestBudget:
+        return self._budget
+
+    @property
+    def hibernating(self) -> set[str]:
+        return self._hibernating
+
+    @property
+    def restored(self) -> bool:
+        return self._api.restored
+
+    @property
+    def coordinators(self) -> dict[str, HonCoordinator]:
+        return self._coordinators
+
+    def configured_interval(self, appliance: HonAppliance) -> int | None:
+        appliance_intervals = self._options.get(CONF_APPLIANCE_INTERVALS) or {}
+        if (interval := appliance_intervals.get(appliance.unique_id)) is not None:
+            return int(interval)
+        type_intervals = self._options.get(CONF_TYPE_INTERVALS) or {}
+        if (interval := type_intervals.get(appliance.appliance_type)) is not None:
+            return int(interval)
+        if (interval := self._options.get(CONF_SCAN_INTERVAL)) is not None:
+            return int(interval)
+        return None
+
+    @callback
+    def async_set_options(self, options: Mapping[str, Any]) -> None:
+        self._options = options
+        for coordinator in self._coordinators.values():
+            self._set_next_poll(coordinator)
+        self.async_schedule()
+
+    def get_coordinator(self, appliance: HonAppliance) -> HonCoordinator:
+        if (coordinator := self._coordinators.get(appliance.unique_id)) is None:
+            coordinator = HonCoordinator(self._hass, appliance, self)
+            self._coordinators[appliance.unique_id] = coordinator
+            self._phases.add(appliance.unique_id)
+            self._set_next_poll(coordinator)
+            for tier, interval in TIER_INTERVALS.items():
+                expires = self._hass.loop.time() + interval
+                self._tier_expires[(appliance.unique_id, tier)] = expires
+        return coordinator
+
+    def _set_next_poll(self, coordinator: HonCoordinator) -> None:
+        unique_id = coordinator.device.unique_id
+        now = self._hass.loop.time()
+        interval: float
+        if unique_id in self._hibernating:
+            interval = HIBERNATE_INTERVAL
+        else:
+            interval = coordinator.poll_interval
+        interval *= 1 + BUDGET_STRETCH * self._budget.pressure
+        next_poll = self._phases.align(unique_id, now + interval, interval)
+        if unique_id not in self._hibernating and coordinator.deadline is not None:
+            deadline = now + coordinator.deadline + random.uniform(0, POLL_JITTER)
+            next_poll = min(next_poll, deadline)
+        if (converging := self._converging.get(unique_id)) is not None:
+            next_poll = min(next_poll, now + CONVERGE_DELAYS[converging[1]])
+        self._next_poll[unique_id] = next_poll
+
+    @callback
+    def async_converge(self, appliance: HonAppliance, targets: dict[str, str]) -> None:
+        """Poll in short, growing steps until the targets are reported back"""
+        self._converging[appliance.unique_id] = (targets, 0)
+        self._set_next_poll(self.get_coordinator(appliance))
+        self.async_schedule()
+
+    def _track_convergence(self, appliance: HonAppliance) -> None:
+        if (converging := self._converging.get(appliance.unique_id)) is None:
+            return
+        targets, step = converging
+        parameters = appliance.attributes.get("parameters", {})
+        if step + 1 >= len(CONVERGE_DELAYS) or all(
+            not parameters[key].lock and _matches(parameters[key], value)
+            for key, value in targets.items()
+            if key in parameters
+        ):
+            self._converging.pop(appliance.unique_id)
+        else:
+            self._converging[appliance.unique_id] = (targets, step + 1)
+
+    def _track_connection(self, coordinator: HonCoordinator) -> None:
+        unique_id = coordinator.device.unique_id
+        if not coordinator.disconnected:
+            self._disconnected_since.pop(unique_id, None)
+            return
+        now = self._hass.loop.time()
+        since = self._disconnected_since.setdefault(unique_id, now)
+        if now - since >= HIBERNATE_AFTER and unique_id not in self._hibernating:
+            _LOGGER.info("%s - Disconnected, hibernating", coordinator.device.nick_name)
+            self._hibernating.add(unique_id)
+
+    def _probe(self, appliance: HonAppliance) -> bool:
+        """Wake a hibernating appliance once its attributes report a connection"""
+        if self.get_coordinator(appliance).disconnected:
+            return False
+        _LOGGER.info("%s - Reconnected, waking up", appliance.nick_name)
+        self.async_wake(appliance)
+        return True
+
+    @callback
+    def async_wake(self, appliance: HonAppliance) -> None:
+        self._hibernating.discard(appliance.unique_id)
+        self._disconnected_since.pop(appliance.unique_id, None)
+
+    @staticmethod
+    async def _async_load_tier(appliance: HonAppliance, tier: str) -> dict[str, Any]:
+        if tier == "statistics":
+            return await appliance.api.load_statistics(appliance)
+        return await appliance.api.load_maintenance(appliance)
+
+    async def _async_update_tiers(self, appliance: HonAppliance) -> None:
+        now = self._hass.loop.time()
+        tiers = [
+            tier
+            for tier in TIER_INTERVALS
+            if self._tier_expires.get((appliance.unique_id, tier), 0) <= now
+            and self._budget.try_acquire()
+        ]
+        results = await asyncio.gather(
+            *[self._async_load_tier(appliance, tier) for tier in tiers],
+            return_exceptions=True,
+        )
+        for tier, result in zip(tiers, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "%s - Can't load %s: %s", appliance.nick_name, tier, result
+                )
+                continue
+            if isinstance(result, dict):
+                appliance.statistics.update(result)
+            self._tier_expires[(appliance.unique_id, tier)] = now + TIER_INTERVALS[tier]
+
+    async def async_reconcile(self) -> None:
+        """Replace the restored snapshot with live data from the cloud"""
+        async with self._reconcile_lock:
+            if not self._api.restored:
+                return
+            restored = await self._api.load_appliances()
+            try:
+                async with asyncio.timeout(POLL_TIMEOUT):
+                    appliances = await self._api.async_connect()
+            except Exception as error:  # pylint: disable=broad-except
+                self._breaker.failure()
+                delay = min(
+                    RECONNECT_BACKOFF * 2**self._reconnects, BREAKER_BACKOFF_MAX
+                )
+                delay *= random.uniform(0.8, 1.2)
+                self._reconnects += 1
+                _LOGGER.warning(
+                    "%s - Can't connect, keeping restored state, retry in %.0f s: %s",
+                    self._hon.email,
+                    delay,
+                    error,
+                )
+                self._unsub_reconnect = async_call_later(
+                    self._hass, delay, self._async_reconnect
+                )
+                return
+            self._breaker.success()
+            self._reconnects = 0
+        if {(a.get("macAddress"), a.get("fwVersion")) for a in appliances} != {
+            (a.get("macAddress"), a.get("fwVersion")) for a in restored
+        }:
+            _LOGGER.info("%s - Appliances changed, reloading", self._hon.email)
+            await self._async_reload_entry()
+            return
+        # Replace the restored data in a regular poll, within its limits
+        now = self._hass.loop.time()
+        for unique_id in self._coordinators:
+            self._next_poll[unique_id] = now
+            for tier in TIER_INTERVALS:
+                self._tier_expires[(unique_id, tier)] = now
+        self.async_stop()
+        await self._async_poll(dt_util.utcnow())
+
+    async def _async_reconnect(self, _now: datetime) -> None:
+        self._unsub_reconnect = None
+        await self.async_reconcile()
+
+    async def _async_revalidate(self, appliance: HonAppliance) -> None:
+        if not self._api.catalog.expired(appliance.info):
+            return
+        if not self._budget.try_acquire():
+            return
+        if await self._api.async_revalidate(appliance):
+            _LOGGER.info("%s - Commands changed, reloading", appliance.nick_name)
+            await self._async_reload_entry()
+
+    async def _async_reload_entry(self) -> None:
+        """Rebuild the appliances and their entities from scratch"""
+        if self._reloading:
+            return
+        self._reloading = True
+        await self._api.async_flush()
+        self._hass.async_create_task(
+            self._hass.config_entries.async_reload(self._entry.entry_id)
+        )
+
+    async def _async_fetch(self, appliance: HonAppliance, priority: bool) -> None:
+        # hOn has no cheaper endpoint, so the probe is a normal attribute load
+        hibernating = appliance.unique_id in self._hibernating
+        # Priority refreshes keep pyhOn's minimal update interval, which
+        # absorbs the refreshes of back to back commands
+        converging = not priority and appliance.unique_id in self._converging
+        await appliance.update(force=hibernating or converging)
+        if hibernating and not self._probe(appliance):
+            return
+        await self._async_update_tiers(appliance)
+        await self._async_revalidate(appliance)
+
+    async def _async_update(
+        self, coordinator: HonCoordinator, priority: bool = False
+    ) -> bool:
+        """Poll one appliance, return False if no request was sent"""
+        self._set_next_poll(coordinator)
+        if self._api.restored:
+            return False
+        # Waiting for the budget is not part of the cloud deadline
+        if priority:
+            await self._budget.acquire()
+        elif not self._budget.try_acquire():
+            return False
+        try:
+            async with self._semaphore, asyncio.timeout(POLL_TIMEOUT):
+                await self._async_fetch(coordinator.device, priority)
+        except TimeoutError:
+            coordinator.async_set_stale()
+            # The caller decides whether a timeout counts against the account
+            raise
+        except Exception:
+            self._breaker.failure()
+            raise
+        else:
+            self._breaker.success()
+            self._api.async_save()
+            coordinator.stale = False
+            self._track_connection(coordinator)
+            self._track_convergence(coordinator.device)
+        finally:
+            self._set_next_poll(coordinator)
+        return True
+
+    async def async_refresh(self, appliance: HonAppliance) -> None:
+        if not self._breaker.allow():
+            raise UpdateFailed(
+                f"Requests paused for {self._breaker.retry_in:.0f} s after failures"
+            )
+        try:
+            self.async_wake(appliance)
+            with suppress(TimeoutError):
+                await self._async_update(self.get_coordinator(appliance), priority=True)
+        finally:
+            self._breaker.release()
+        self.async_schedule()
+
+    async def async_config_entry_first_refresh(
+        self, profiler: HonSetupProfiler
+    ) -> None:
+        """Refresh every appliance once, before any entity is created"""
+
+        async def first_refresh(coordinator: HonCoordinator) -> None:
+            with profiler.phase(f"first_refresh[{coordinator.device.nick_name}]"):
+                await coordinator.async_config_entry_first_refresh()
+
+        await asyncio.gather(
+            *[first_refresh(coordinator) for coordinator in self._coordinators.values()]
+        )
+
+    @callback
+    def async_schedule(self) -> None:
+        """Arm the next poll, async_reconcile arms it once the data is live"""
+        self.async_stop()
+        if not self._next_poll or self._api.restored:
+            return
+        delay = min(self._next_poll.values()) - self._hass.loop.time()
+        delay = max(delay, self._breaker.retry_in)
+        self._unsub_poll = async_call_later(self._hass, max(delay, 0), self._async_poll)
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+
+    @callback
+    def async_shutdown(self) -> None:
+        self.async_stop()
+        if self._unsub_reconnect is not None:
+            self._unsub_reconnect()
+            self._unsub_reconnect = None
+        for unique_id in self._coordinators:
+            self._phases.remove(unique_id)
+
+    async def _async_poll(self, _now: datetime) -> None:
+        self._unsub_poll = None
+        if self._hass.is_stopping or self._api.restored:
+            return
+        if not self._breaker.allow():
+            self.async_schedule()
+            return
+        due = self._hass.loop.time() + POLL_SLACK
+        coordinators = [
+            coordinator
+            for unique_id, coordinator in self._coordinators.items()
+            if self._next_poll[unique_id] <= due
+        ]
+        if self._breaker.state == HonBreakerState.HALF_OPEN:
+            coordinators = coordinators[:1]
+        try:
+            results = await asyncio.gather(
+                *[self._async_update(coordinator) for coordinator in coordinators],
+                return_exceptions=True,
+            )
+        finally:
+            self._breaker.release()
+        if results and all(isinstance(result, TimeoutError) for result in results):
+            # A slow appliance stays stale, only a batch without answers trips
+            self._breaker.failure()
+        for coordinator, result in zip(coordinators, results):
+            if isinstance(result, TimeoutError):
+                continue
+            if isinstance(result, Exception):
+                coordinator.async_set_update_error(result)
+            elif result:
+                coordinator.async_set_updated_data(None)
+        self.async_schedule()
+
+
+def _matches(first: Any, second: Any) -> bool:
+    with suppress(TypeError, ValueError):
+        return float(str(first)) == float(str(second))
+    return str(first) == str(second)
@@ -0,0 +1,74 @@
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import HomeAssistantType
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SetupEntry = Callable[
+    [HomeAssistantType, ConfigEntry, AddEntitiesCallback], Awaitable[None]
+]
+
+
+class HonSetupProfiler:
+    """Time the phases of an entry setup and log them in one line."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._start = monotonic()
+        self._phases: dict[str, float] = {}
+        self._total: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = monotonic()
+        try:
+            yield
+        finally:
+            if self._total is None:
+                self._phases[name] = self._phases.get(name, 0) + monotonic() - start
+
+    def finish(self) -> None:
+        self._total = monotonic() - self._start
+        _LOGGER.info(
+            "%s - Setup took %.2f s (%s)",
+            self._name,
+            self._total,
+            ", ".join(f"{name} {time:.2f} s" for name, time in self._phases.items()),
+        )
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "total": None if self._total is None else round(self._total, 3),
+            "phases": {name: round(time, 3) for name, time in self._phases.items()},
+        }
+
+
+def get_profiler(hass: HomeAssistantType, entry: ConfigEntry) -> HonSetupProfiler:
+    profiler: HonSetupProfiler = hass.data[DOMAIN]["profilers"][entry.unique_id]
+    return profiler
+
+
+def profile_platform(setup_entry: SetupEntry) -> SetupEntry:
+    """Add the duration of a platform setup to the entry profile"""
+    platform = setup_entry.__module__.rsplit(".", 1)[-1]
+
+    @wraps(setup_entry)
+    async def wrapper(
+        hass: HomeAssistantType,
+        entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        with get_profiler(hass, entry).phase(f"platform[{platform}]"):
+            await setup_entry(hass, entry, async_add_entities)
+
+    return wrapper
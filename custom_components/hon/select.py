@@ -12,8 +12,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import HomeAssistantType
 
 from . import const
-from .const import DOMAIN
-from .hon import HonEntity, unique_entities, get_readable
+from .discovery import HonApplianceIndex, get_plan
+from .hon import HonEntity, HonDescriptions, get_readable
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,189 +30,195 @@ class HonConfigSelectEntityDescription(SelectEntityDescription):
     option_list: dict[int, str] | None = None
 
 
-SELECTS: dict[str, tuple[SelectEntityDescription, ...]] = {
-    "WM": (
-        HonConfigSelectEntityDescription(
-            key="startProgram.spinSpeed",
-            name="Spin speed",
-            icon="mdi:numeric",
-            unit_of_measurement=REVOLUTIONS_PER_MINUTE,
-            translation_key="spin_speed",
+SELECTS: HonDescriptions[SelectEntityDescription] = HonDescriptions(
+    {
+        "WM": lambda: (
+            HonConfigSelectEntityDescription(
+                key="startProgram.spinSpeed",
+                name="Spin speed",
+                icon="mdi:numeric",
+                unit_of_measurement=REVOLUTIONS_PER_MINUTE,
+                translation_key="spin_speed",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.temp",
+                name="Temperature",
+                icon="mdi:thermometer",
+                unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="temperature",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_wm",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.steamLevel",
+                name="Steam level",
+                icon="mdi:weather-dust",
+                translation_key="steam_level",
+                option_list=const.STEAM_LEVEL,
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.dirtyLevel",
+                name="Dirty level",
+                icon="mdi:liquid-spot",
+                translation_key="dirt_level",
+                option_list=const.DIRTY_LEVEL,
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.extendedStainType",
+                name="Stain Type",
+                icon="mdi:liquid-spot",
+                translation_key="stain_type",
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.temp",
-            name="Temperature",
-            icon="mdi:thermometer",
-            unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="temperature",
+        "TD": lambda: (
+            HonConfigSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_td",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.dryTimeMM",
+                name="Dry Time",
+                icon="mdi:timer",
+                unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="dry_time",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.dryLevel",
+                name="Dry level",
+                icon="mdi:hair-dryer",
+                translation_key="dry_levels",
+                option_list=const.TUMBLE_DRYER_DRY_LEVEL,
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_wm",
+        "OV": lambda: (
+            HonConfigSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_ov",
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.steamLevel",
-            name="Steam level",
-            icon="mdi:weather-dust",
-            translation_key="steam_level",
-            option_list=const.STEAM_LEVEL,
+        "IH": lambda: (
+            HonConfigSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_ih",
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.dirtyLevel",
-            name="Dirty level",
-            icon="mdi:liquid-spot",
-            translation_key="dirt_level",
-            option_list=const.DIRTY_LEVEL,
+        "DW": lambda: (
+            HonConfigSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_dw",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.temp",
+                name="Temperature",
+                icon="mdi:thermometer",
+                unit_of_measurement=UnitOfTemperature.CELSIUS,
+                translation_key="temperature",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.remainingTime",
+                name="Remaining Time",
+                icon="mdi:timer",
+                unit_of_measurement=UnitOfTime.MINUTES,
+                translation_key="remaining_time",
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.extendedStainType",
-            name="Stain Type",
-            icon="mdi:liquid-spot",
-            translation_key="stain_type",
+        "AC": lambda: (
+            HonSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_ac",
+            ),
+            HonSelectEntityDescription(
+                key="settings.humanSensingStatus",
+                name="Eco Pilot",
+                icon="mdi:run",
+                translation_key="eco_pilot",
+                option_list=const.AC_HUMAN_SENSE,
+            ),
+            HonSelectEntityDescription(
+                key="settings.windDirectionHorizontal",
+                name="Fan Direction Horizontal",
+                icon="mdi:fan",
+                translation_key="fan_horizontal",
+                option_list=const.AC_POSITION_HORIZONTAL,
+            ),
+            HonSelectEntityDescription(
+                key="settings.windDirectionVertical",
+                name="Fan Direction Vertical",
+                icon="mdi:fan",
+                translation_key="fan_vertical",
+                option_list=const.AC_POSITION_VERTICAL,
+            ),
         ),
-    ),
-    "TD": (
-        HonConfigSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_td",
+        "REF": lambda: (
+            HonConfigSelectEntityDescription(
+                key="startProgram.program",
+                name="Program",
+                translation_key="programs_ref",
+            ),
+            HonConfigSelectEntityDescription(
+                key="startProgram.zone",
+                name="Zone",
+                icon="mdi:radiobox-marked",
+                translation_key="ref_zones",
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.dryTimeMM",
-            name="Dry Time",
-            icon="mdi:timer",
-            unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="dry_time",
+        "AP": lambda: (
+            HonSelectEntityDescription(
+                key="settings.aromaStatus",
+                name="Diffuser Level",
+                option_list=const.AP_DIFFUSER_LEVEL,
+                translation_key="diffuser",
+                icon="mdi:air-purifier",
+            ),
+            HonSelectEntityDescription(
+                key="settings.machMode",
+                name="Mode",
+                icon="mdi:play",
+                option_list=const.AP_MACH_MODE,
+                translation_key="mode",
+            ),
         ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.dryLevel",
-            name="Dry level",
-            icon="mdi:hair-dryer",
-            translation_key="dry_levels",
-            option_list=const.TUMBLE_DRYER_DRY_LEVEL,
-        ),
-    ),
-    "OV": (
-        HonConfigSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_ov",
-        ),
-    ),
-    "IH": (
-        HonConfigSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_ih",
-        ),
-    ),
-    "DW": (
-        HonConfigSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_dw",
-        ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.temp",
-            name="Temperature",
-            icon="mdi:thermometer",
-            unit_of_measurement=UnitOfTemperature.CELSIUS,
-            translation_key="temperature",
-        ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.remainingTime",
-            name="Remaining Time",
-            icon="mdi:timer",
-            unit_of_measurement=UnitOfTime.MINUTES,
-            translation_key="remaining_time",
-        ),
-    ),
-    "AC": (
-        HonSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_ac",
-        ),
-        HonSelectEntityDescription(
-            key="settings.humanSensingStatus",
-            name="Eco Pilot",
-            icon="mdi:run",
-            translation_key="eco_pilot",
-            option_list=const.AC_HUMAN_SENSE,
-        ),
-        HonSelectEntityDescription(
-            key="settings.windDirectionHorizontal",
-            name="Fan Direction Horizontal",
-            icon="mdi:fan",
-            translation_key="fan_horizontal",
-            option_list=const.AC_POSITION_HORIZONTAL,
-        ),
-        HonSelectEntityDescription(
-            key="settings.windDirectionVertical",
-            name="Fan Direction Vertical",
-            icon="mdi:fan",
-            translation_key="fan_vertical",
-            option_list=const.AC_POSITION_VERTICAL,
-        ),
-    ),
-    "REF": (
-        HonConfigSelectEntityDescription(
-            key="startProgram.program",
-            name="Program",
-            translation_key="programs_ref",
-        ),
-        HonConfigSelectEntityDescription(
-            key="startProgram.zone",
-            name="Zone",
-            icon="mdi:radiobox-marked",
-            translation_key="ref_zones",
-        ),
-    ),
-    "AP": (
-        HonSelectEntityDescription(
-            key="settings.aromaStatus",
-            name="Diffuser Level",
-            option_list=const.AP_DIFFUSER_LEVEL,
-            translation_key="diffuser",
-            icon="mdi:air-purifier",
-        ),
-        HonSelectEntityDescription(
-            key="settings.machMode",
-            name="Mode",
-            icon="mdi:play",
-            option_list=const.AP_MACH_MODE,
-            translation_key="mode",
-        ),
-    ),
-}
+    }
+)
 
-SELECTS["WD"] = unique_entities(SELECTS["WM"], SELECTS["TD"])
+SELECTS.merge("WD", "WM", "TD")
 
 
+def discover(index: HonApplianceIndex, description: SelectEntityDescription) -> bool:
+    return index.has_setting(description.key)
+
+
+@profile_platform
 async def async_setup_entry(
     hass: HomeAssistantType, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     entities = []
     entity: HonSelectEntity | HonConfigSelectEntity
-    for device in hass.data[DOMAIN][entry.unique_id].appliances:
-        for description in SELECTS.get(device.appliance_type, []):
-            if description.key not in device.available_settings:
-                continue
-            if isinstance(description, HonSelectEntityDescription):
-                entity = HonSelectEntity(hass, entry, device, description)
-            elif isinstance(description, HonConfigSelectEntityDescription):
-                entity = HonConfigSelectEntity(hass, entry, device, description)
-            else:
-                continue
-            await entity.coordinator.async_config_entry_first_refresh()
-            entities.append(entity)
+    for device, description in get_plan(hass, entry, "select"):
+        if isinstance(description, HonSelectEntityDescription):
+            entity = HonSelectEntity(hass, entry, device, description)
+        elif isinstance(description, HonConfigSelectEntityDescription):
+            entity = HonConfigSelectEntity(hass, entry, device, description)
+        else:
+            continue
+        entities.append(entity)
     async_add_entities(entities)
 
 
 class HonConfigSelectEntity(HonEntity, SelectEntity):
     entity_description: HonConfigSelectEntityDescription
 
+    def watched_keys(self) -> set[str]:
+        return {self.entity_description.key}
+
     @property
     def current_option(self) -> str | None:
         if not (setting := self._device.settings.get(self.entity_description.key)):
@@ -262,6 +269,9 @@ class HonConfigSelectEntity(HonEntity, SelectEntity):
 class HonSelectEntity(HonEntity, SelectEntity):
     entity_description: HonSelectEntityDescription
 
+    def watched_keys(self) -> set[str]:
+        return {self.entity_description.key}
+
     @property
     def current_option(self) -> str | None:
         if not (setting := self._device.settings.get(self.entity_description.key)):
@@ -294,7 +304,7 @@ class HonSelectEntity(HonEntity, SelectEntity):
         setting = self._device.settings[self.entity_description.key]
         setting.value = self._option_to_number(option, setting.values)
         command = self.entity_description.key.split(".")[0]
-        await self._device.commands[command].send()
+        await self.coordinator.async_send_command(command)
         if command != "settings":
             self._device.sync_command(command, "settings")
         await self.coordinator.async_refresh()
@@ -302,11 +312,7 @@ class HonSelectEntity(HonEntity, SelectEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and int(self._device.get("remoteCtrValid", 1)) == 1
-            and self._device.get("attributes.lastConnEvent.category") != "DISCONNECTED"
-        )
+        return self.controllable
 
     @callback
     def _handle_coordinator_update(self, update: bool = True) -> None:
@@ -0,0 +1,228 @@
+from contextlib import suppress
+from copy import deepcopy
+from datetime import datetime
+from typing import Any, TypeVar
+
+from aiohttp import ClientSession
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import HomeAssistantType
+from pyhon import Hon, HonAPI
+from pyhon.appliance import HonAppliance
+from pyhon.connection.auth import HonAuth, HonAuthData
+from pyhon.exceptions import NoAuthenticationException
+from typing_extensions import Self
+
+from .catalog import HonCatalog
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+from .profiler import HonSetupProfiler
+
+_T = TypeVar("_T")
+
+
+class HonSnapshotAPI(HonAPI):
+    """Serve the last known appliance data until the hOn cloud is reachable.
+
+    The snapshot also keeps the auth tokens, so a restart can skip the login.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        entry_id: str,
+        catalog: HonCatalog,
+        profiler: HonSetupProfiler,
+        email: str,
+        password: str,
+        session: ClientSession | None = None,
+    ) -> None:
+        super().__init__(email, password, anonymous=True, session=session)
+        self._store: Store[dict[str, Any]] = snapshot_store(hass, entry_id)
+        self._catalog = catalog
+        self._profiler = profiler
+        self._snapshot: dict[str, Any] = {}
+        self._api: HonAPI | None = None
+        self._appliances: list[dict[str, Any]] | None = None
+
+    @property
+    def restored(self) -> bool:
+        """Appliance data comes from the snapshot, not from the cloud"""
+        return self._api is None
+
+    @property
+    def catalog(self) -> HonCatalog:
+        return self._catalog
+
+    @property
+    def live(self) -> HonAPI:
+        if self._api is None:
+            raise NoAuthenticationException("Missing hOn login")
+        return self._api
+
+    async def async_load(self) -> bool:
+        self._snapshot = await self._store.async_load() or {}
+        appliances = self._snapshot.get("appliances", [])
+        return bool(appliances) and all(
+            self._catalog.get(appliance) is not None for appliance in appliances
+        )
+
+    async def async_connect(self) -> list[dict[str, Any]]:
+        """Log in and switch over to live data"""
+        api = await HonAPI(self._email, self._password, session=self._session).create()
+        self._restore_auth(api.auth)
+        return self.attach(api, await api.load_appliances())
+
+    def attach(
+        self, api: HonAPI, appliances: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Switch over to live data of a logged in session"""
+        self._snapshot["appliances"] = deepcopy(appliances)
+        # The next setup gets the appliances just loaded instead of asking again
+        self._appliances = appliances
+        self._api = api
+        return appliances
+
+    def _restore_auth(self, auth: HonAuth) -> None:
+        """Reuse the tokens of the last session, pyhOn logs in again on rejection"""
+        if (data := self._snapshot.get("auth", {})).get("email") != self._email:
+            return
+        # pyhOn has no public way to resume a session
+        auth._auth = HonAuthData(**data["tokens"])
+        auth._expires = datetime.fromisoformat(data["expires"])
+        auth._device._mobile_id = data["mobile_id"]
+
+    def _data(self) -> dict[str, Any]:
+        with suppress(NoAuthenticationException):
+            if self._api is not None and (auth := self._api.auth).cognito_token:
+                self._snapshot["auth"] = {
+                    "email": self._email,
+                    "tokens": {
+                        "access_token": auth.access_token,
+                        "refresh_token": auth.refresh_token,
+                        "cognito_token": auth.cognito_token,
+                        "id_token": auth.id_token,
+                    },
+                    "expires": auth._expires.isoformat(),
+                    "mobile_id": auth._device.mobile_id,
+                }
+        return self._snapshot
+
+    @callback
+    def async_save(self) -> None:
+        self._store.async_delay_save(self._data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        await self._store.async_save(self._data())
+
+    def _device(self, appliance: HonAppliance) -> dict[str, Any]:
+        devices: dict[str, dict[str, Any]] = self._snapshot.setdefault("devices", {})
+        return devices.setdefault(appliance.unique_id, {})
+
+    def _restore(self, appliance: HonAppliance, key: str, default: _T) -> _T:
+        value: _T = self._device(appliance).get(key, default)
+        return deepcopy(value)
+
+    def _record(self, appliance: HonAppliance, key: str, value: _T) -> _T:
+        self._device(appliance)[key] = deepcopy(value)
+        return value
+
+    async def load_appliances(self) -> list[dict[str, Any]]:
+        if self._api is None:
+            appliances: list[dict[str, Any]] = self._snapshot.get("appliances", [])
+            return deepcopy(appliances)
+        if (loaded := self._appliances) is not None:
+            self._appliances = None
+            return loaded
+        return await self._api.load_appliances()
+
+    async def load_commands(self, appliance: HonAppliance) -> dict[str, Any]:
+        if (commands := self._catalog.get(appliance.info)) is not None:
+            return commands
+        with self._profiler.phase(f"catalog[{appliance.nick_name}]"):
+            commands = await self.live.load_commands(appliance)
+        self._catalog.async_set(appliance.info, commands)
+        return commands
+
+    async def async_revalidate(self, appliance: HonAppliance) -> bool:
+        """Fetch the cached commands again and return if they changed"""
+        commands = await self.live.load_commands(appliance)
+        return self._catalog.async_set(appliance.info, commands)
+
+    async def load_command_history(
+        self, appliance: HonAppliance
+    ) -> list[dict[str, Any]]:
+        if self._api is None:
+            return self._restore(appliance, "command_history", [])
+        history = await self._api.load_command_history(appliance)
+        names: set[str] = set()
+        latest = []
+        for command in history:
+            if (name := command.get("command", {}).get("commandName")) not in names:
+                names.add(name)
+                latest.append(command)
+        self._record(appliance, "command_history", latest)
+        return history
+
+    async def load_favourites(self, appliance: HonAppliance) -> list[dict[str, Any]]:
+        if self._api is None:
+            return self._restore(appliance, "favourites", [])
+        favourites = await self._api.load_favourites(appliance)
+        return self._record(appliance, "favourites", favourites)
+
+    async def load_last_activity(self, appliance: HonAppliance) -> dict[str, Any]:
+        return await self.live.load_last_activity(appliance)
+
+    async def load_appliance_data(self, appliance: HonAppliance) -> dict[str, Any]:
+        return await self.live.load_appliance_data(appliance)
+
+    async def load_attributes(self, appliance: HonAppliance) -> dict[str, Any]:
+        if self._api is None:
+            return self._restore(appliance, "attributes", {})
+        attributes = await self._api.load_attributes(appliance)
+        return self._record(appliance, "attributes", attributes)
+
+    async def load_statistics(self, appliance: HonAppliance) -> dict[str, Any]:
+        if self._api is None:
+            statistics: dict[str, Any] = self._restore(appliance, "statistics", {})
+            return statistics | self._restore(appliance, "maintenance", {})
+        result = await self._api.load_statistics(appliance)
+        return self._record(appliance, "statistics", result)
+
+    async def load_maintenance(self, appliance: HonAppliance) -> dict[str, Any]:
+        if self._api is None:
+            return self._restore(appliance, "maintenance", {})
+        maintenance = await self._api.load_maintenance(appliance)
+        return self._record(appliance, "maintenance", maintenance)
+
+    async def send_command(
+        self,
+        appliance: HonAppliance,
+        command: str,
+        parameters: dict[str, Any],
+        ancillary_parameters: dict[str, Any],
+        program_name: str = "",
+    ) -> bool:
+        return await self.live.send_command(
+            appliance, command, parameters, ancillary_parameters, program_name
+        )
+
+    async def close(self) -> None:
+        if self._api is not None:
+            await self._api.close()
+        await super().close()
+
+
+class HonSession(Hon):
+    """Hon account which loads its appliances through the snapshot api."""
+
+    def __init__(self, api: HonSnapshotAPI, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._api = api
+
+    async def create(self) -> Self:
+        await self.setup()
+        return self
+
+
+def snapshot_store(hass: HomeAssistantType, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True)